@@ -2,9 +2,12 @@
 from __future__ import annotations
 
 import logging
+import random
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
     ACTION_LOCK,
@@ -32,6 +35,11 @@ ATTR_OPERATION_EVENT = 0x0100
 # Onesti custom: last used PIN code as ASCII digits (attribute 0x0101)
 ATTR_LAST_PIN_CODE = 0x0101
 
+# Upper bound (seconds) for the random delay before the capability read.
+# Spreads reads out so several locks set up together don't all hit the
+# Zigbee network — and their sleepy parent routers — in the same instant.
+CAPABILITY_READ_JITTER = 30
+
 _SOURCE_MAP = {
     0x00: SOURCE_ZIGBEE,
     0x02: SOURCE_KEYPAD,
@@ -64,8 +72,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _register_event_listener(hass, entry, coordinator)
 
     # Read lock capabilities in the background — lock may be sleeping and
-    # we don't want to block setup on a slow/missing response
-    hass.async_create_task(coordinator.read_lock_capabilities())
+    # we don't want to block setup on a slow/missing response. Wait until
+    # HA has started so the read doesn't compete with startup traffic.
+    @callback
+    def _read_capabilities(_now) -> None:
+        # Background task: cancelled on unload instead of holding it up
+        # while a sleeping lock lets the read time out
+        entry.async_create_background_task(
+            hass,
+            coordinator.read_lock_capabilities(),
+            f"onesti_lock {coordinator.ieee} capability read",
+        )
+
+    read_capabilities_job = HassJob(
+        _read_capabilities, name=f"onesti_lock {coordinator.ieee} capability read timer"
+    )
+
+    @callback
+    def _schedule_capability_read(_hass: HomeAssistant) -> None:
+        entry.async_on_unload(
+            async_call_later(
+                hass, random.uniform(0, CAPABILITY_READ_JITTER), read_capabilities_job
+            )
+        )
+
+    # Capabilities are static and persisted after the first successful read
+    if not coordinator.lock_capabilities:
+        entry.async_on_unload(async_at_started(hass, _schedule_capability_read))
 
     return True
 
@@ -123,15 +156,12 @@ def _decode_pin_code(raw) -> str | None:
     if all(0x30 <= b <= 0x39 for b in data):
         return data.decode("ascii")
 
-    # BCD packed: every nibble must be 0-9
-    nibbles: list[str] = []
-    for byte in data:
-        high = (byte >> 4) & 0x0F
-        low = byte & 0x0F
-        if high > 9 or low > 9:
-            return None  # Not valid BCD either
-        nibbles.append(f"{high}{low}")
-    return "".join(nibbles) or None
+    # BCD packed: hex() yields one character per nibble, so the bytes are
+    # valid BCD exactly when every hex character is a decimal digit
+    digits = data.hex()
+    if not digits.isdigit():
+        return None  # Not valid BCD either
+    return digits
 
 
 def _decode_operation_event(coordinator, val: int) -> dict | None:
@@ -173,14 +203,12 @@ def _register_event_listener(
         _LOGGER.error("Could not find DoorLock cluster for event listener")
         return
 
-    def _on_attribute_report(event) -> None:
-        if event.attribute_id == ATTR_LAST_PIN_CODE:
-            coordinator.update_last_pin_code(_decode_pin_code(event.raw_value))
-            return
-
-        if event.attribute_id != ATTR_OPERATION_EVENT:
-            return
+    @callback
+    def _on_last_pin_code(event) -> None:
+        coordinator.update_last_pin_code(_decode_pin_code(event.raw_value))
 
+    @callback
+    def _on_operation_event(event) -> None:
         raw = event.raw_value
         try:
             val = int(raw)
@@ -216,6 +244,19 @@ def _register_event_listener(
             {"ieee": coordinator.ieee, **decoded},
         )
 
+    # Every Report_Attributes frame on the cluster lands here, so dispatch
+    # on attribute id with a single dict lookup
+    handlers = {
+        ATTR_OPERATION_EVENT: _on_operation_event,
+        ATTR_LAST_PIN_CODE: _on_last_pin_code,
+    }
+
+    @callback
+    def _on_attribute_report(event) -> None:
+        handler = handlers.get(event.attribute_id)
+        if handler is not None:
+            handler(event)
+
     unsub = cluster.on_event("attribute_report", _on_attribute_report)
     hass.data[DOMAIN][entry.entry_id]["unsub_listener"] = unsub
 
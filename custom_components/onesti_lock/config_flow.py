@@ -19,6 +19,7 @@ from .const import (
     DOMAIN,
     MANUFACTURER,
     MAX_SLOTS,
+    NUM_USER_SLOTS,
     SLOT_FIRST_USER,
     SUPPORTED_MODELS,
     ZHA_DOMAIN,
@@ -26,6 +27,33 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# User slots shown in the options flow — same slots as the sensors (3-12)
+_USER_SLOTS = range(SLOT_FIRST_USER, SLOT_FIRST_USER + NUM_USER_SLOTS)
+
+
+@callback
+def _scan_nimly_devices(device_proxies, existing: set[str]) -> dict[str, str]:
+    """Return {ieee: label} for supported Onesti locks not yet configured.
+
+    Runs in the event loop on purpose: ZHA device objects are owned by the
+    loop and not safe to read from an executor thread, and the scan only
+    reads cached manufacturer/model strings — no Zigbee I/O.
+    """
+    devices = {}
+    for ieee, proxy in device_proxies.items():
+        device = proxy.device if hasattr(proxy, "device") else proxy
+        # Most devices on a ZHA network are not Onesti — reject them on
+        # the manufacturer before touching anything else
+        if getattr(device, "manufacturer", "") != MANUFACTURER:
+            continue
+        model = getattr(device, "model", "")
+        if model not in SUPPORTED_MODELS:
+            continue
+        ieee_str = str(ieee)
+        if ieee_str not in existing:
+            devices[ieee_str] = f"{model} ({ieee_str})"
+    return devices
+
 
 class NimlyProConfigFlow(ConfigFlow, domain=DOMAIN):
     """Config flow for Onesti Lock."""
@@ -46,19 +74,10 @@ class NimlyProConfigFlow(ConfigFlow, domain=DOMAIN):
         if not hasattr(zha_data, "gateway_proxy") or zha_data.gateway_proxy is None:
             return self.async_abort(reason="zha_not_found")
 
-        devices = {}
-        for ieee, proxy in zha_data.gateway_proxy.device_proxies.items():
-            device = proxy.device if hasattr(proxy, "device") else proxy
-            manufacturer = getattr(device, "manufacturer", "")
-            model = getattr(device, "model", "")
-            if manufacturer == MANUFACTURER and model in SUPPORTED_MODELS:
-                ieee_str = str(ieee)
-                existing = {
-                    entry.data.get(CONF_IEEE)
-                    for entry in self._async_current_entries()
-                }
-                if ieee_str not in existing:
-                    devices[ieee_str] = f"{model} ({ieee_str})"
+        existing = {
+            entry.data.get(CONF_IEEE) for entry in self._async_current_entries()
+        }
+        devices = _scan_nimly_devices(zha_data.gateway_proxy.device_proxies, existing)
 
         if not devices:
             return self.async_abort(reason="no_devices_found")
@@ -98,7 +117,7 @@ class NimlyProOptionsFlow(OptionsFlow):
         """Build set_pin form schema, optionally pre-filling values."""
         slots = self.config_entry.options.get("slots", {})
         slot_options = {}
-        for i in range(SLOT_FIRST_USER, SLOT_FIRST_USER + 10):
+        for i in _USER_SLOTS:
             name = slots.get(str(i), {}).get("name", "")
             label = f"Slot {i} — {name}" if name else f"Slot {i} — Ledig"
             slot_options[str(i)] = label
@@ -174,7 +193,8 @@ class NimlyProOptionsFlow(OptionsFlow):
         """Show spinner while set_pin runs in background."""
         if not self._set_pin_task:
             self._set_pin_task = self.hass.async_create_task(
-                self._do_set_pin()
+                self._do_set_pin(),
+                name=f"onesti_lock {self.config_entry.entry_id} set_pin",
             )
 
         return self.async_show_progress(
@@ -216,9 +236,14 @@ class NimlyProOptionsFlow(OptionsFlow):
         errors: dict[str, str] = {}
 
         # Build schema first to check for active slots
+        # Only used slots are stored — walk those instead of all MAX_SLOTS.
+        # name_slot accepts any int, so keep the ZCL slot bound here.
         slots = self.config_entry.options.get("slots", {})
+        slot_ids = sorted(
+            i for i in (int(key) for key in slots if key.isdigit()) if i < MAX_SLOTS
+        )
         active_slots = {}
-        for i in range(MAX_SLOTS):
+        for i in slot_ids:
             slot_data = slots.get(str(i), {})
             if slot_data.get("has_pin") or slot_data.get("name"):
                 name = slot_data.get("name", "")
@@ -258,7 +283,8 @@ class NimlyProOptionsFlow(OptionsFlow):
         """Show spinner while clear_pin runs in background."""
         if not self._clear_pin_task:
             self._clear_pin_task = self.hass.async_create_task(
-                self._do_clear_pin()
+                self._do_clear_pin(),
+                name=f"onesti_lock {self.config_entry.entry_id} clear_pin",
             )
 
         return self.async_show_progress(
@@ -318,7 +344,7 @@ class NimlyProOptionsFlow(OptionsFlow):
         """View current slot status — shown as description text."""
         slots = self.config_entry.options.get("slots", {})
         lines = []
-        for i in range(SLOT_FIRST_USER, SLOT_FIRST_USER + 10):
+        for i in _USER_SLOTS:
             slot_data = slots.get(str(i), {})
             name = slot_data.get("name", "")
             has_pin = slot_data.get("has_pin", False)
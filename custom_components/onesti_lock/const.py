@@ -18,7 +18,7 @@ NUM_USER_SLOTS = 10  # Shows slots 3-12
 # All model_id strings from zigbee-herdsman-converters (onesti.ts)
 # EasyAccess series: easyCodeTouch_v1, EasyCodeTouch, EasyFingerTouch
 # Nimly series: NimlyPRO, NimlyPRO24, NimlyCode, NimlyTouch, NimlyIn, NimlyShared
-SUPPORTED_MODELS = [
+SUPPORTED_MODELS = frozenset({
     "NimlyPRO",
     "NimlyPRO24",
     "NimlyCode",
@@ -28,7 +28,7 @@ SUPPORTED_MODELS = [
     "easyCodeTouch_v1",
     "EasyCodeTouch",
     "EasyFingerTouch",
-]
+})
 MANUFACTURER = "Onesti Products AS"
 
 # ZCL Door Lock commands
@@ -3,10 +3,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
 from .const import (
     CONF_IEEE,
@@ -18,6 +19,45 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Standard ZCL DoorLock attributes (per zigpy.zcl.clusters.closures):
+#   0x0012 NumberOfPINUsersSupported
+#   0x0017 MaxPINCodeLength
+#   0x0018 MinPINCodeLength
+_CAPABILITY_ATTRS = {
+    0x0012: "num_pin_users",
+    0x0017: "max_pin_length",
+    0x0018: "min_pin_length",
+}
+_CAPABILITY_ATTR_IDS = list(_CAPABILITY_ATTRS)
+
+# Max attributes per Read_Attributes frame. ZCL frames to a sleepy end
+# device are practically limited to ~5 attributes before the response
+# gets fragmented or dropped, so larger reads are split.
+_READ_CHUNK_SIZE = 4
+
+
+def _find_doorlock_cluster(proxy):
+    """Find the Door Lock cluster below a ZHA device proxy.
+
+    Walks the ZHA object chain: ZHADeviceProxy → Device → CustomDeviceV2
+    because clusters live on the deepest zigpy device object, not the
+    ZHA wrapper layers.
+    """
+    obj = proxy
+    for _ in range(4):
+        if hasattr(obj, "endpoints"):
+            for ep_id, ep in obj.endpoints.items():
+                if ep_id == 0:
+                    continue
+                cluster = getattr(ep, "in_clusters", {}).get(DOORLOCK_CLUSTER_ID)
+                if cluster is not None:
+                    return cluster
+        if hasattr(obj, "device"):
+            obj = obj.device
+        else:
+            break
+    return None
+
 
 class NimlyCoordinator:
     """Manages slot data and ZHA communication for one Nimly lock."""
@@ -27,9 +67,13 @@ class NimlyCoordinator:
         self.entry = entry
         self.ieee: str = entry.data[CONF_IEEE]
         self._slots: dict[str, dict[str, Any]] = {}
-        self._listeners: list = []
+        self._listeners: dict[int | None, list[Callable[[], None]]] = {}
         self._activity_sensor = None
-        self.lock_capabilities: dict[str, Any] = {}
+        self._cluster = None
+        self._lock_unique_id: str | None = None
+        self.lock_capabilities: dict[str, Any] = dict(
+            entry.options.get("capabilities", {})
+        )
         self._load_slots()
 
     def _load_slots(self) -> None:
@@ -64,9 +108,12 @@ class NimlyCoordinator:
 
     async def set_slot_name(self, slot: int, name: str) -> None:
         """Set name for a slot (does not send ZCL command)."""
-        self._slots.setdefault(str(slot), {**DEFAULT_SLOT})["name"] = name
+        slot_data = self._slots.setdefault(str(slot), {**DEFAULT_SLOT})
+        if slot_data["name"] == name:
+            return
+        slot_data["name"] = name
         await self._save_slots()
-        self._notify_listeners()
+        self._notify_listeners(slot)
 
     # -- Activity sensor --
 
@@ -74,11 +121,13 @@ class NimlyCoordinator:
         """Register the activity sensor for updates."""
         self._activity_sensor = sensor
 
+    @callback
     def update_activity(self, user_slot, action, source) -> None:
         """Update the activity sensor."""
         if self._activity_sensor:
             self._activity_sensor.update_activity(user_slot, action, source)
 
+    @callback
     def update_last_pin_code(self, pin_code: str | None) -> None:
         """Store the last-used PIN code (attrid 0x0101).
 
@@ -95,22 +144,18 @@ class NimlyCoordinator:
         min_pin_length. Degrades silently if the lock does not expose them —
         some Onesti variants skip these standard ZCL attributes, and a sleepy
         device may never respond.
+
+        The values are static, so they are persisted in the config entry
+        options and the read is skipped once they are known.
         """
+        if self.lock_capabilities:
+            return
+
         cluster = self._get_cluster()
         if cluster is None:
             return
-        # Standard ZCL DoorLock attributes (per zigpy.zcl.clusters.closures):
-        #   0x0012 NumberOfPINUsersSupported
-        #   0x0017 MaxPINCodeLength
-        #   0x0018 MinPINCodeLength
-        attr_ids = [0x0012, 0x0017, 0x0018]
-        attr_names = {
-            0x0012: "num_pin_users",
-            0x0017: "max_pin_length",
-            0x0018: "min_pin_length",
-        }
         try:
-            result = await cluster.read_attributes(attr_ids)
+            success, failure = await self._read_attributes(cluster, _CAPABILITY_ATTR_IDS)
         except TimeoutError:
             _LOGGER.debug("Lock capabilities read timed out — lock asleep or out of range")
             return
@@ -124,26 +169,49 @@ class NimlyCoordinator:
             _LOGGER.debug("Lock capabilities read failed", exc_info=True)
             return
 
-        # zigpy returns (success_dict, failure_dict). Keys may be attribute
-        # IDs or attribute names depending on cluster metadata.
-        success = result[0] if isinstance(result, tuple) and len(result) >= 1 else {}
-        failure = result[1] if isinstance(result, tuple) and len(result) >= 2 else {}
         if failure:
             _LOGGER.debug("Lock did not expose capabilities: %s", failure)
         for attr_id, value in success.items():
-            name = attr_names.get(attr_id)
+            name = _CAPABILITY_ATTRS.get(attr_id)
             if name and value is not None:
                 self.lock_capabilities[name] = int(value)
 
+        if self.lock_capabilities:
+            self.hass.config_entries.async_update_entry(
+                self.entry,
+                options={**self.entry.options, "capabilities": self.lock_capabilities},
+            )
+
     # -- ZHA cluster access --
 
+    @staticmethod
+    async def _read_attributes(cluster, attr_ids: list[int]) -> tuple[dict, dict]:
+        """Read attributes in frames of at most _READ_CHUNK_SIZE.
+
+        Returns merged (success, failure) dicts. Errors propagate to the
+        caller — a sleepy lock that misses one frame will miss the rest.
+        """
+        success: dict = {}
+        failure: dict = {}
+        for start in range(0, len(attr_ids), _READ_CHUNK_SIZE):
+            result = await cluster.read_attributes(attr_ids[start:start + _READ_CHUNK_SIZE])
+            # zigpy returns (success_dict, failure_dict). Keys may be attribute
+            # IDs or attribute names depending on cluster metadata.
+            if isinstance(result, tuple) and len(result) >= 1:
+                success.update(result[0])
+            if isinstance(result, tuple) and len(result) >= 2:
+                failure.update(result[1])
+        return success, failure
+
     def _get_cluster(self):
         """Get the Door Lock cluster from ZHA.
 
-        Walks the ZHA object chain: ZHADeviceProxy → Device → CustomDeviceV2
-        because clusters live on the deepest zigpy device object, not the
-        ZHA wrapper layers.
+        The ZHA device registry is only walked on the first call; the
+        resolved cluster is cached for the lifetime of the coordinator.
         """
+        if self._cluster is not None:
+            return self._cluster
+
         if ZHA_DOMAIN not in self.hass.data:
             _LOGGER.error("ZHA not found")
             return None
@@ -154,28 +222,48 @@ class NimlyCoordinator:
             _LOGGER.error("ZHA gateway_proxy not found")
             return None
 
-        for dev_ieee, proxy in zha_data.gateway_proxy.device_proxies.items():
-            if str(dev_ieee).lower() != self.ieee.lower():
-                continue
-
-            # Walk down .device chain until we find clusters
-            obj = proxy
-            for _ in range(4):
-                if hasattr(obj, "endpoints"):
-                    for ep_id, ep in obj.endpoints.items():
-                        if ep_id == 0:
-                            continue
-                        clusters = getattr(ep, "in_clusters", {})
-                        if DOORLOCK_CLUSTER_ID in clusters:
-                            return clusters[DOORLOCK_CLUSTER_ID]
-                if hasattr(obj, "device"):
-                    obj = obj.device
-                else:
-                    break
+        ieee = self.ieee.lower()
+        proxy = next(
+            (
+                p
+                for dev_ieee, p in zha_data.gateway_proxy.device_proxies.items()
+                if str(dev_ieee).lower() == ieee
+            ),
+            None,
+        )
+        if proxy is not None:
+            self._cluster = _find_doorlock_cluster(proxy)
+            if self._cluster is not None:
+                return self._cluster
 
         _LOGGER.error("Door Lock cluster not found for %s", self.ieee)
         return None
 
+    def _get_lock_entity_id(self) -> str | None:
+        """Find the ZHA lock entity for this device.
+
+        The full registry scan only runs until the entity's unique_id is
+        known; after that it is an indexed lookup, which also follows
+        entity_id renames.
+        """
+        from homeassistant.helpers import entity_registry as er
+        registry = er.async_get(self.hass)
+
+        if self._lock_unique_id is not None:
+            entity_id = registry.async_get_entity_id("lock", ZHA_DOMAIN, self._lock_unique_id)
+            if entity_id is not None:
+                return entity_id
+            self._lock_unique_id = None
+
+        for entity in registry.entities.values():
+            if entity.platform != ZHA_DOMAIN:
+                continue
+            uid = entity.unique_id or ""
+            if self.ieee.lower() in uid.lower() and uid.endswith("257"):
+                self._lock_unique_id = uid
+                return entity.entity_id
+        return None
+
     async def _wake_lock(self) -> None:
         """Wake the lock by sending a lock state read via ZHA.
 
@@ -183,22 +271,16 @@ class NimlyCoordinator:
         so this reliably wakes the lock's Zigbee radio.
         """
         try:
-            # Find the lock entity for this device
-            from homeassistant.helpers import entity_registry as er
-            registry = er.async_get(self.hass)
-            for entity in registry.entities.values():
-                if entity.platform != "zha":
-                    continue
-                uid = entity.unique_id or ""
-                if self.ieee.lower() in uid.lower() and uid.endswith("257"):
-                    _LOGGER.debug("Waking lock via %s", entity.entity_id)
-                    await self.hass.services.async_call(
-                        "lock", "lock",
-                        {"entity_id": entity.entity_id},
-                        blocking=True,
-                    )
-                    await asyncio.sleep(1)
-                    return
+            entity_id = self._get_lock_entity_id()
+            if entity_id is None:
+                return
+            _LOGGER.debug("Waking lock via %s", entity_id)
+            await self.hass.services.async_call(
+                "lock", "lock",
+                {"entity_id": entity_id},
+                blocking=True,
+            )
+            await asyncio.sleep(1)
         except Exception:
             _LOGGER.debug("Wake attempt failed, proceeding anyway")
 
@@ -276,7 +358,7 @@ class NimlyCoordinator:
             slot_data["name"] = name
             slot_data["has_pin"] = True
             await self._save_slots()
-            self._notify_listeners()
+            self._notify_listeners(slot)
         return success
 
     async def clear_pin(self, slot: int) -> bool:
@@ -288,7 +370,7 @@ class NimlyCoordinator:
         if success:
             self._slots.setdefault(str(slot), {**DEFAULT_SLOT})["has_pin"] = False
             await self._save_slots()
-            self._notify_listeners()
+            self._notify_listeners(slot)
         return success
 
     async def clear_slot(self, slot: int) -> bool:
@@ -300,20 +382,27 @@ class NimlyCoordinator:
         # Reset slot even if command failed — user wants it cleared
         self._slots[str(slot)] = {**DEFAULT_SLOT}
         await self._save_slots()
-        self._notify_listeners()
+        self._notify_listeners(slot)
         return success
 
     # -- Listener pattern for sensors --
 
-    def add_listener(self, callback) -> None:
-        """Register a callback for slot data changes."""
-        self._listeners.append(callback)
-
-    def remove_listener(self, callback) -> None:
-        """Remove a callback."""
-        self._listeners = [cb for cb in self._listeners if cb != callback]
+    def add_listener(self, listener, slot: int | None = None) -> None:
+        """Register a listener for slot data changes.
 
-    def _notify_listeners(self) -> None:
-        """Notify all listeners of data change."""
-        for callback in self._listeners:
-            callback()
+        With a slot, the listener only fires when that slot changes;
+        without one, it fires for every change.
+        """
+        self._listeners.setdefault(slot, []).append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """Remove a listener."""
+        for slot, listeners in list(self._listeners.items()):
+            listeners[:] = [cb for cb in listeners if cb != listener]
+            if not listeners:
+                del self._listeners[slot]
+
+    def _notify_listeners(self, slot: int) -> None:
+        """Notify listeners of a change to slot."""
+        for listener in (*self._listeners.get(slot, ()), *self._listeners.get(None, ())):
+            listener()
@@ -2,17 +2,42 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-
-from .const import DOMAIN, NUM_USER_SLOTS, SLOT_FIRST_USER
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ACTION_LOCK,
+    ACTION_UNKNOWN,
+    ACTION_UNLOCK,
+    DOMAIN,
+    MANUFACTURER,
+    NUM_USER_SLOTS,
+    SLOT_FIRST_USER,
+    SOURCE_AUTO,
+    SOURCE_FINGERPRINT,
+    SOURCE_KEYPAD,
+    SOURCE_RFID,
+    SOURCE_ZIGBEE,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Activity sensor display text: "<name> <verb><suffix>"
+_ACTION_VERBS = {
+    ACTION_UNLOCK: "låste opp",
+    ACTION_LOCK: "låste",
+}
+_SOURCE_SUFFIXES = {
+    SOURCE_KEYPAD: " med kode",
+    SOURCE_FINGERPRINT: " med fingeravtrykk",
+    SOURCE_RFID: " med RFID",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,6 +60,15 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
+def _device_info(coordinator) -> DeviceInfo:
+    """Device info shared by all sensors of one lock."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, coordinator.ieee)},
+        name="Onesti Lock",
+        manufacturer=MANUFACTURER,
+    )
+
+
 class NimlySlotSensor(SensorEntity):
     """Sensor showing who occupies a lock slot."""
 
@@ -46,10 +80,9 @@ class NimlySlotSensor(SensorEntity):
         self._slot = slot
         self._attr_unique_id = f"{coordinator.ieee}-slot-{slot}"
         self._attr_translation_key = f"slot_{slot}"
-
-    @property
-    def name(self) -> str:
-        return f"Slot {self._slot}"
+        self._attr_name = f"Slot {slot}"
+        self._attr_device_info = _device_info(coordinator)
+        self._written_slot_data: dict | None = None
 
     @property
     def native_value(self) -> str:
@@ -65,22 +98,22 @@ class NimlySlotSensor(SensorEntity):
             "has_rfid": slot_data.get("has_rfid", False),
         }
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._coordinator.ieee)},
-            "name": "Onesti Lock",
-            "manufacturer": "Onesti Products AS",
-        }
-
     async def async_added_to_hass(self) -> None:
-        self._coordinator.add_listener(self._handle_update)
+        self._written_slot_data = dict(self._coordinator.get_slot(self._slot))
+        self._coordinator.add_listener(self._handle_update, self._slot)
 
     async def async_will_remove_from_hass(self) -> None:
         self._coordinator.remove_listener(self._handle_update)
 
     @callback
     def _handle_update(self) -> None:
+        # clear_pin on an empty slot or re-setting the same PIN still
+        # notifies — only write when the data behind the state changed.
+        # Copy: get_slot returns the coordinator's live dict.
+        slot_data = dict(self._coordinator.get_slot(self._slot))
+        if slot_data == self._written_slot_data:
+            return
+        self._written_slot_data = slot_data
         self.async_write_ha_state()
 
 
@@ -96,38 +129,23 @@ class NimlyActivitySensor(SensorEntity):
         self._attr_translation_key = "last_activity"
         self._activity: dict = {}
         self._last_pin_code: str | None = None
-
-    @property
-    def name(self) -> str:
-        return "Siste aktivitet"
+        self._attr_name = "Siste aktivitet"
+        self._attr_device_info = _device_info(coordinator)
 
     @property
     def native_value(self) -> str | None:
         if not self._activity:
             return None
         name = self._activity.get("user_name", "Ukjent")
-        action = self._activity.get("action", "unknown")
+        action = self._activity.get("action", ACTION_UNKNOWN)
         source = self._activity.get("source", "")
+        verb = _ACTION_VERBS.get(action, action)
 
-        if action == "unlock":
-            verb = "låste opp"
-        elif action == "lock":
-            verb = "låste"
-        else:
-            verb = action
-
-        if source == "keypad":
-            return f"{name} {verb} med kode"
-        elif source == "fingerprint":
-            return f"{name} {verb} med fingeravtrykk"
-        elif source == "rfid":
-            return f"{name} {verb} med RFID"
-        elif source == "zigbee":
+        if source == SOURCE_ZIGBEE:
             return f"{verb.capitalize()} via Zigbee"
-        elif source == "auto":
+        if source == SOURCE_AUTO:
             return "Auto-lås"
-        else:
-            return f"{name} {verb}"
+        return f"{name} {verb}{_SOURCE_SUFFIXES.get(source, '')}"
 
     @property
     def extra_state_attributes(self) -> dict:
@@ -138,17 +156,13 @@ class NimlyActivitySensor(SensorEntity):
             attrs.update(self._coordinator.lock_capabilities)
         return attrs
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._coordinator.ieee)},
-            "name": "Onesti Lock",
-            "manufacturer": "Onesti Products AS",
-        }
-
     async def async_added_to_hass(self) -> None:
         self._coordinator.set_activity_sensor(self)
 
+    async def async_will_remove_from_hass(self) -> None:
+        self._coordinator.set_activity_sensor(None)
+
+    @callback
     def update_activity(
         self,
         user_slot: int | None,
@@ -165,11 +179,16 @@ class NimlyActivitySensor(SensorEntity):
             "user_slot": user_slot,
             "action": action,
             "source": source,
-            "timestamp": datetime.now().isoformat(),
+            # HA's JSON encoder serializes datetimes when the state is written
+            "timestamp": dt_util.utcnow(),
         }
         self.async_write_ha_state()
 
+    @callback
     def update_last_pin_code(self, pin_code: str | None) -> None:
         """Called by coordinator when attrid 0x0101 reports a PIN."""
+        # Avoid a state write when the same PIN is reported again
+        if pin_code == self._last_pin_code:
+            return
         self._last_pin_code = pin_code
         self.async_write_ha_state()
@@ -26,7 +26,13 @@ def _get_coordinator(hass: HomeAssistant, ieee: str | None = None):
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
-    """Register Onesti Lock services."""
+    """Register Onesti Lock services.
+
+    Called from every config entry setup; services are domain-wide, so
+    only the first entry registers them.
+    """
+    if hass.services.has_service(DOMAIN, "set_pin"):
+        return
 
     async def handle_set_pin(call: ServiceCall) -> None:
         slot = call.data["slot"]
@@ -0,0 +1,55 @@
+"""Tests for the config flow's ZHA device scan.
+
+Loads _scan_nimly_devices from config_flow.py source (avoids HA imports)
+and runs it against fake ZHA device proxies.
+"""
+from __future__ import annotations
+
+import ast
+import os
+from types import SimpleNamespace
+
+_component_dir = os.path.join(os.path.dirname(__file__), "..", "custom_components", "onesti_lock")
+
+
+def _load_scan():
+    ns: dict = {}
+    with open(os.path.join(_component_dir, "const.py")) as f:
+        exec(f.read(), ns)
+    path = os.path.join(_component_dir, "config_flow.py")
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "_scan_nimly_devices":
+            node.decorator_list = []
+            exec(compile(ast.Module(body=[node], type_ignores=[]), path, "exec"), ns)
+            return ns["_scan_nimly_devices"]
+    raise AssertionError("_scan_nimly_devices not found")
+
+
+_scan = _load_scan()
+
+
+def _proxy(manufacturer: str, model: str):
+    return SimpleNamespace(device=SimpleNamespace(manufacturer=manufacturer, model=model))
+
+
+class TestScanNimlyDevices:
+    def test_finds_supported_lock(self):
+        proxies = {"aa:bb": _proxy("Onesti Products AS", "NimlyPRO")}
+        assert _scan(proxies, set()) == {"aa:bb": "NimlyPRO (aa:bb)"}
+
+    def test_skips_other_manufacturers_and_models(self):
+        proxies = {
+            "01": _proxy("IKEA of Sweden", "NimlyPRO"),
+            "02": _proxy("Onesti Products AS", "UnknownModel"),
+            "03": SimpleNamespace(device=SimpleNamespace()),
+        }
+        assert _scan(proxies, set()) == {}
+
+    def test_skips_already_configured(self):
+        proxies = {
+            "aa:bb": _proxy("Onesti Products AS", "NimlyPRO"),
+            "cc:dd": _proxy("Onesti Products AS", "EasyCodeTouch"),
+        }
+        assert _scan(proxies, {"aa:bb"}) == {"cc:dd": "EasyCodeTouch (cc:dd)"}
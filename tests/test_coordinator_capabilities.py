@@ -6,7 +6,9 @@ min_pin_length as attributes when the lock reports them.
 from __future__ import annotations
 
 import ast
+import logging
 import os
+from types import SimpleNamespace
 
 
 _coordinator_path = os.path.join(
@@ -86,3 +88,135 @@ class TestActivitySensorAttributes:
         with open(sensor_path) as f:
             source = f.read()
         assert "lock_capabilities" in source
+
+
+def _load_read_attributes():
+    """Compile NimlyCoordinator._read_attributes in isolation (avoids HA imports)."""
+    tree = ast.parse(_source())
+    chunk_size = None
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == "_READ_CHUNK_SIZE" for t in node.targets
+        ):
+            chunk_size = ast.literal_eval(node.value)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "_read_attributes":
+            node.decorator_list = []
+            module = ast.Module(body=[node], type_ignores=[])
+            ns: dict = {"_READ_CHUNK_SIZE": chunk_size}
+            exec(compile(module, _coordinator_path, "exec"), ns)
+            return ns["_read_attributes"], chunk_size
+    raise AssertionError("_read_attributes not found")
+
+
+class _FakeCluster:
+    def __init__(self):
+        self.calls: list[list[int]] = []
+
+    async def read_attributes(self, attr_ids):
+        self.calls.append(list(attr_ids))
+        return ({a: a for a in attr_ids if a % 2 == 0}, {a: 0x86 for a in attr_ids if a % 2})
+
+
+class TestChunkedRead:
+    async def test_splits_and_merges(self):
+        read, chunk_size = _load_read_attributes()
+        cluster = _FakeCluster()
+        attr_ids = list(range(chunk_size * 2 + 1))
+        success, failure = await read(cluster, attr_ids)
+        assert all(len(call) <= chunk_size for call in cluster.calls)
+        assert [a for call in cluster.calls for a in call] == attr_ids
+        assert set(success) == {a for a in attr_ids if a % 2 == 0}
+        assert set(failure) == {a for a in attr_ids if a % 2}
+
+    async def test_single_frame_for_capabilities(self):
+        """The three capability attributes fit in one frame — one radio round-trip."""
+        read, _ = _load_read_attributes()
+        cluster = _FakeCluster()
+        await read(cluster, [0x0012, 0x0017, 0x0018])
+        assert len(cluster.calls) == 1
+
+
+def _load_capability_reader():
+    """Build a class with read_lock_capabilities and _read_attributes (no HA dependency)."""
+    tree = ast.parse(_source())
+    ns: dict = {"_LOGGER": logging.getLogger(__name__)}
+    constants = [
+        node for node in tree.body
+        if isinstance(node, ast.Assign)
+        and any(isinstance(t, ast.Name) and t.id.startswith(("_CAPABILITY", "_READ")) for t in node.targets)
+    ]
+    exec(compile(ast.Module(body=constants, type_ignores=[]), _coordinator_path, "exec"), ns)
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "NimlyCoordinator":
+            methods = [
+                n for n in node.body
+                if isinstance(n, ast.AsyncFunctionDef)
+                and n.name in ("read_lock_capabilities", "_read_attributes")
+            ]
+            cls = ast.ClassDef(
+                name="CapabilityReader", bases=[], keywords=[], body=methods, decorator_list=[]
+            )
+            module = ast.fix_missing_locations(ast.Module(body=[cls], type_ignores=[]))
+            exec(compile(module, _coordinator_path, "exec"), ns)
+            return ns["CapabilityReader"]
+    raise AssertionError("NimlyCoordinator not found")
+
+
+class _FakeConfigEntries:
+    def __init__(self):
+        self.updates: list[dict] = []
+
+    def async_update_entry(self, entry, options):
+        self.updates.append(options)
+        entry.options = options
+
+
+class _CapabilityCluster:
+    def __init__(self, success: dict):
+        self.success = success
+        self.calls = 0
+
+    async def read_attributes(self, attr_ids):
+        self.calls += 1
+        return ({a: v for a, v in self.success.items() if a in attr_ids}, {})
+
+
+class TestCapabilityPersistence:
+    def _reader(self, success: dict, capabilities: dict | None = None):
+        reader = _load_capability_reader()()
+        cluster = _CapabilityCluster(success)
+        reader._get_cluster = lambda: cluster
+        reader.hass = SimpleNamespace(config_entries=_FakeConfigEntries())
+        reader.entry = SimpleNamespace(options={"slots": {"3": {"name": "Kari"}}})
+        reader.lock_capabilities = dict(capabilities or {})
+        return reader, cluster
+
+    async def test_skips_read_when_capabilities_known(self):
+        reader, cluster = self._reader({0x0012: 50}, capabilities={"num_pin_users": 50})
+
+        await reader.read_lock_capabilities()
+
+        assert cluster.calls == 0
+        assert reader.hass.config_entries.updates == []
+
+    async def test_persists_capabilities_alongside_slots(self):
+        reader, _ = self._reader({0x0012: 50, 0x0017: 8, 0x0018: 4})
+
+        await reader.read_lock_capabilities()
+
+        assert reader.hass.config_entries.updates == [
+            {
+                "slots": {"3": {"name": "Kari"}},
+                "capabilities": {"num_pin_users": 50, "max_pin_length": 8, "min_pin_length": 4},
+            }
+        ]
+
+    async def test_nothing_persisted_when_lock_exposes_nothing(self):
+        reader, cluster = self._reader({})
+
+        await reader.read_lock_capabilities()
+
+        assert cluster.calls == 1
+        assert reader.hass.config_entries.updates == []
+        assert reader.lock_capabilities == {}
@@ -0,0 +1,125 @@
+"""Tests for Door Lock cluster discovery in the coordinator.
+
+Loads _find_doorlock_cluster from coordinator.py source and runs it
+against fake ZHA object chains (ZHADeviceProxy → Device → CustomDeviceV2).
+"""
+from __future__ import annotations
+
+import ast
+import logging
+import os
+from types import SimpleNamespace
+
+_coordinator_path = os.path.join(
+    os.path.dirname(__file__), "..", "custom_components", "onesti_lock", "coordinator.py"
+)
+
+
+def _source() -> str:
+    with open(_coordinator_path) as f:
+        return f.read()
+
+
+def _load_find_doorlock_cluster():
+    tree = ast.parse(_source())
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "_find_doorlock_cluster":
+            module = ast.Module(body=[node], type_ignores=[])
+            ns: dict = {"DOORLOCK_CLUSTER_ID": 0x0101}
+            exec(compile(module, _coordinator_path, "exec"), ns)
+            return ns["_find_doorlock_cluster"]
+    raise AssertionError("_find_doorlock_cluster not found")
+
+
+_find = _load_find_doorlock_cluster()
+
+
+def _device(in_clusters: dict, ep_id: int = 11):
+    return SimpleNamespace(
+        endpoints={
+            0: SimpleNamespace(in_clusters={0x0101: "zdo"}),
+            ep_id: SimpleNamespace(in_clusters=in_clusters),
+        }
+    )
+
+
+class TestFindDoorlockCluster:
+    def test_cluster_on_deepest_device(self):
+        """Clusters live on CustomDeviceV2, two .device hops below the proxy."""
+        custom = _device({0x0101: "doorlock"})
+        proxy = SimpleNamespace(device=SimpleNamespace(device=custom))
+        assert _find(proxy) == "doorlock"
+
+    def test_skips_zdo_endpoint(self):
+        assert _find(_device({})) is None
+
+    def test_missing_cluster_returns_none(self):
+        proxy = SimpleNamespace(device=_device({0x0000: "basic"}))
+        assert _find(proxy) is None
+
+
+def _load_get_cluster_class():
+    """Build a class with the coordinator's _get_cluster (no HA dependency)."""
+    tree = ast.parse(_source())
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "NimlyCoordinator":
+            method = next(
+                n for n in node.body if isinstance(n, ast.FunctionDef) and n.name == "_get_cluster"
+            )
+            cls = ast.ClassDef(
+                name="ClusterLookup", bases=[], keywords=[], body=[method], decorator_list=[]
+            )
+            module = ast.fix_missing_locations(ast.Module(body=[cls], type_ignores=[]))
+            ns: dict = {
+                "ZHA_DOMAIN": "zha",
+                "_LOGGER": logging.getLogger(__name__),
+                "_find_doorlock_cluster": _find,
+            }
+            exec(compile(module, _coordinator_path, "exec"), ns)
+            return ns["ClusterLookup"]
+    raise AssertionError("NimlyCoordinator not found")
+
+
+class _CountingProxies(dict):
+    """device_proxies dict that counts how often it is scanned."""
+
+    scans = 0
+
+    def items(self):
+        self.scans += 1
+        return super().items()
+
+
+class TestClusterCache:
+    def _coordinator(self):
+        proxies = _CountingProxies(
+            {
+                "11:22": _device({0x0101: "other-lock"}),
+                "AA:BB": SimpleNamespace(device=_device({0x0101: "doorlock"})),
+            }
+        )
+        coordinator = _load_get_cluster_class()()
+        coordinator.hass = SimpleNamespace(
+            data={"zha": SimpleNamespace(gateway_proxy=SimpleNamespace(device_proxies=proxies))}
+        )
+        coordinator.ieee = "aa:bb"
+        coordinator._cluster = None
+        return coordinator, proxies
+
+    def test_get_cluster_scans_zha_once(self):
+        coordinator, proxies = self._coordinator()
+
+        assert coordinator._get_cluster() == "doorlock"
+        assert coordinator._get_cluster() == "doorlock"
+
+        assert proxies.scans == 1
+
+    def test_missing_cluster_is_not_cached(self):
+        """A failed lookup must be retried — ZHA may not have loaded the device yet."""
+        coordinator, proxies = self._coordinator()
+        coordinator.ieee = "ff:ff"
+
+        assert coordinator._get_cluster() is None
+        assert coordinator._get_cluster() is None
+
+        assert proxies.scans == 2
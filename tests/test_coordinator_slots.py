@@ -130,3 +130,62 @@ class TestSlotLogic:
         assert slots["5"]["name"] == ""
         assert slots["5"]["has_pin"] is False
         assert slots["5"]["has_rfid"] is False
+
+
+def _load_listener_class():
+    """Build a class with the coordinator's listener methods (no HA dependency)."""
+    with open(_component_path("coordinator.py")) as f:
+        tree = ast.parse(f.read())
+    names = {"__init__", "add_listener", "remove_listener", "_notify_listeners"}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == "NimlyCoordinator":
+            methods = [
+                n for n in node.body
+                if isinstance(n, ast.FunctionDef) and n.name in names - {"__init__"}
+            ]
+            init = ast.parse("def __init__(self):\n    self._listeners = {}").body[0]
+            cls = ast.ClassDef(
+                name="Listeners", bases=[], keywords=[], body=[init, *methods], decorator_list=[]
+            )
+            module = ast.fix_missing_locations(ast.Module(body=[cls], type_ignores=[]))
+            ns: dict = {}
+            exec(compile(module, "coordinator.py", "exec"), ns)
+            return ns["Listeners"]
+    pytest.fail("NimlyCoordinator not found in coordinator.py")
+
+
+class TestSlotScopedListeners:
+    """Slot sensors must only be woken for changes to their own slot."""
+
+    def test_slot_listener_only_fires_for_its_slot(self):
+        coordinator = _load_listener_class()()
+        calls: list[str] = []
+        coordinator.add_listener(lambda: calls.append("slot3"), 3)
+        coordinator.add_listener(lambda: calls.append("slot4"), 4)
+
+        coordinator._notify_listeners(3)
+
+        assert calls == ["slot3"]
+
+    def test_unscoped_listener_fires_for_every_slot(self):
+        coordinator = _load_listener_class()()
+        calls: list[int] = []
+        coordinator.add_listener(lambda: calls.append(1))
+
+        coordinator._notify_listeners(3)
+        coordinator._notify_listeners(200)
+
+        assert calls == [1, 1]
+
+    def test_remove_listener(self):
+        coordinator = _load_listener_class()()
+        calls: list[int] = []
+
+        def cb():
+            calls.append(1)
+
+        coordinator.add_listener(cb, 3)
+        coordinator.remove_listener(cb)
+        coordinator._notify_listeners(3)
+
+        assert calls == []